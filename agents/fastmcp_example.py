@@ -45,20 +45,17 @@ async def main():
             for tool in tools.tools:
                 print(f"  - {tool.name}: {tool.description}")
             
-            # Example: Check server health
-            print("\nChecking server health...")
-            health_result = await session.call_tool("server_health", {})
+            # Example: Check server health, list organizations and list programs.
+            # The calls are independent, so issue them concurrently.
+            print("\nChecking server health, listing organizations and bug bounty programs...")
+            health_result, orgs_result, programs_result = await asyncio.gather(
+                session.call_tool("server_health", {}),
+                session.call_tool("get_organizations", {"query_params": "page[limit]=5"}),
+                session.call_tool("get_programs", {"query_params": "page[limit]=3"})
+            )
             print(f"Health status: {health_result.content}")
-            
-            # Example: List organizations
-            print("\nListing organizations...")
-            orgs_result = await session.call_tool("get_organizations", {"query_params": "page[limit]=5"})
-            print(f"Organizations: {orgs_result.content}")
-            
-            # Example: List programs
-            print("\nListing bug bounty programs...")
-            programs_result = await session.call_tool("get_programs", {"query_params": "page[limit]=3"})
-            print(f"Programs: {programs_result.content}")
+            print(f"\nOrganizations: {orgs_result.content}")
+            print(f"\nPrograms: {programs_result.content}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
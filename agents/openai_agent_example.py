@@ -6,9 +6,34 @@ This demonstrates how to integrate the Bugcrowd API through MCP with OpenAI agen
 
 import asyncio
 import os
+import sys
 from agents import Agent, Runner
 from agents.mcp import MCPServerStdio
 
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    Unlike running input() in a worker thread, waiting here can be cancelled,
+    so Ctrl+C exits immediately instead of hanging until Enter is pressed.
+    """
+    loop = asyncio.get_running_loop()
+    line = loop.create_future()
+
+    def on_readable():
+        if not line.done():
+            line.set_result(sys.stdin.readline())
+
+    print(prompt, end="", flush=True)
+    loop.add_reader(sys.stdin, on_readable)
+    try:
+        text = await line
+    finally:
+        loop.remove_reader(sys.stdin)
+
+    if not text:
+        raise EOFError
+    return text.rstrip("\n")
+
 async def main():
     """Example usage of Bugcrowd MCP server with OpenAI Agent."""
 
@@ -31,7 +56,9 @@ async def main():
                 "BUGCROWD_API_USERNAME": os.getenv("BUGCROWD_API_USERNAME"),
                 "BUGCROWD_API_PASSWORD": os.getenv("BUGCROWD_API_PASSWORD")
             }
-        }
+        },
+        # The server's tool set is static, so list it once instead of on every agent turn
+        cache_tools_list=True
     ) as server:
 
         # List available tools from the MCP server
@@ -69,7 +96,8 @@ async def main():
         # Interactive loop (basic example)
         while True:
             try:
-                user_input = input("\nEnter your question (or 'quit' to exit): ")
+                # Read input without blocking the event loop serving the MCP connection
+                user_input = await ainput("\nEnter your question (or 'quit' to exit): ")
                 if user_input.lower() in ['quit', 'exit', 'q']:
                     break
 
@@ -77,12 +105,14 @@ async def main():
                 response = await Runner.run(agent, user_input)
                 print(f"\nAssistant: {response}")
 
-            except KeyboardInterrupt:
-                print("\nExiting...")
+            except EOFError:
                 break
             except Exception as e:
                 print(f"Error: {e}")
 
 if __name__ == "__main__":
-
-    asyncio.run(main())
+    # Ctrl+C cancels main() and surfaces here once asyncio.run has cleaned up
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nExiting...")
@@ -13,21 +13,21 @@ Features:
 - Defensive security focus
 """
 
+import asyncio
 import os
 import re
 import logging
-from typing import Dict, Any, Optional, Union
-from urllib.parse import unquote_plus
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from typing import AsyncIterator, Dict, Any, Generator, Optional, Tuple, Union
+from urllib.parse import parse_qsl
 
 import httpx
+import ijson
+import orjson
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 
-# Import cleanup for proper shutdown
-import atexit
-
-# Register cleanup function
-atexit.register(lambda: None)
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -35,46 +35,131 @@ logger = logging.getLogger(__name__)
 # Bugcrowd API Configuration
 BUGCROWD_API_BASE = "https://api.bugcrowd.com"
 BUGCROWD_API_VERSION = "2025-04-23"
-DEFAULT_TIMEOUT = 30.0
+# Reads may be slow, but connect and pool acquisition should fail fast so retries kick in
+DEFAULT_TIMEOUT = float(os.getenv("BUGCROWD_TIMEOUT", "30.0"))
+CONNECT_TIMEOUT = float(os.getenv("BUGCROWD_CONNECT_TIMEOUT", "5.0"))
+WRITE_TIMEOUT = float(os.getenv("BUGCROWD_WRITE_TIMEOUT", "10.0"))
+POOL_TIMEOUT = float(os.getenv("BUGCROWD_POOL_TIMEOUT", "5.0"))
 MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 0.1
+MAX_RETRY_DELAY = 10.0
+MAX_CONNECTIONS = int(os.getenv("BUGCROWD_MAX_CONNECTIONS", "1000"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("BUGCROWD_MAX_KEEPALIVE", "100"))
+# GET response caching is off unless a positive TTL (seconds) is configured
+CACHE_TTL = float(os.getenv("BUGCROWD_CACHE_TTL", "0"))
+CACHE_MAXSIZE = int(os.getenv("BUGCROWD_CACHE_MAXSIZE", "512"))
+# List pages larger than this are decoded incrementally while streaming
+STREAM_PAGE_LIMIT_THRESHOLD = int(os.getenv("BUGCROWD_STREAM_THRESHOLD", "100"))
+
+# Validation patterns (anchored with \Z so a trailing newline is rejected)
+_PARAM_KEY_RE = re.compile(r'^[a-zA-Z0-9_\[\].]+\Z')
+_RESOURCE_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+
+# Streaming decode only pays off with ijson's C backend; without it large pages
+# are decoded with orjson like every other response
+try:
+    _ijson_backend = ijson.get_backend("yajl2_c")
+except ImportError:
+    _ijson_backend = None
+
+# Shared result for calls without query parameters; callers never mutate it
+_EMPTY_PARAMS: Dict[str, str] = {}
+
+# Static headers sent with every request; bound to the shared client
+_DEFAULT_HEADERS = {
+    "Accept": "application/vnd.bugcrowd+json",
+    "Bugcrowd-Version": BUGCROWD_API_VERSION,
+    "User-Agent": "Bugcrowd-MCP-Server/1.0.0"
+}
 
 # Global HTTP client for connection pooling
 _http_client: Optional[httpx.AsyncClient] = None
-_api_credentials: Optional[Dict[str, str]] = None
 
-def _load_api_credentials() -> Dict[str, str]:
-    """Load and cache API credentials from environment variables."""
-    global _api_credentials
+# In-process cache of GET responses (None when caching is disabled)
+_get_cache: Optional[TTLCache] = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL) if CACHE_TTL > 0 else None
+
+# Bumped on every write so reads that started before it are never cached
+_cache_generation = 0
+
+# In-flight GET requests, so concurrent identical reads share one API call
+_inflight_requests: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], "asyncio.Task[Dict[str, Any]]"] = {}
+
+# Sleep used between retries; a module-level name so tests can replace it
+_sleep = asyncio.sleep
+
+def _load_api_credentials() -> Tuple[str, str]:
+    """Load API credentials from environment variables."""
+    username = os.getenv("BUGCROWD_API_USERNAME")
+    password = os.getenv("BUGCROWD_API_PASSWORD")
     
-    if _api_credentials is None:
-        username = os.getenv("BUGCROWD_API_USERNAME")
-        password = os.getenv("BUGCROWD_API_PASSWORD")
-        
-        if not username or not password:
-            raise RuntimeError(
-                "BUGCROWD_API_USERNAME and BUGCROWD_API_PASSWORD must be set in environment variables. "
-                "Please configure your Bugcrowd API credentials."
-            )
-        
-        _api_credentials = {"username": username, "password": password}
-        logger.info("Bugcrowd API credentials loaded successfully")
+    if not username or not password:
+        raise RuntimeError(
+            "BUGCROWD_API_USERNAME and BUGCROWD_API_PASSWORD must be set in environment variables. "
+            "Please configure your Bugcrowd API credentials."
+        )
     
-    return _api_credentials
+    logger.info("Bugcrowd API credentials loaded successfully")
+    return username, password
 
 
-async def _get_http_client() -> httpx.AsyncClient:
-    """Get or create a shared HTTP client with connection pooling."""
-    global _http_client
+class BugcrowdAuth(httpx.Auth):
+    """Authenticate requests with Bugcrowd's ``Token username:password`` scheme.
     
-    if _http_client is None or _http_client.is_closed:
-        _http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
-            follow_redirects=True
-        )
-        logger.info("HTTP client initialized with connection pooling")
+    Credentials are loaded on first use and the header value is cached, so the
+    server can start (and report unhealthy) before credentials are configured.
+    """
     
-    return _http_client
+    def __init__(self) -> None:
+        self._authorization: Optional[str] = None
+    
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        if self._authorization is None:
+            username, password = _load_api_credentials()
+            self._authorization = f"Token {username}:{password}"
+        
+        request.headers["Authorization"] = self._authorization
+        yield request
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client with connection pooling."""
+    client = httpx.AsyncClient(
+        base_url=BUGCROWD_API_BASE,
+        headers=_DEFAULT_HEADERS,
+        auth=BugcrowdAuth(),
+        timeout=httpx.Timeout(
+            DEFAULT_TIMEOUT,
+            connect=CONNECT_TIMEOUT,
+            write=WRITE_TIMEOUT,
+            pool=POOL_TIMEOUT
+        ),
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_CONNECTIONS
+        ),
+        http2=True,
+        follow_redirects=True
+    )
+    logger.info("HTTP client initialized with connection pooling")
+    return client
+
+
+@lru_cache(maxsize=1024)
+def _parse_query_pairs(query_params: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse and validate a query string into an immutable, cacheable tuple of pairs."""
+    # Segments without "=" are ignored, and keys/values are stripped after decoding
+    query = "&".join(segment for segment in query_params.split("&") if "=" in segment)
+    pairs = [
+        (key.strip(), value.strip())
+        for key, value in parse_qsl(query, keep_blank_values=True)
+    ]
+    
+    # Validate parameter names (alphanumeric, underscore, brackets, dots)
+    for key, _ in pairs:
+        if not _PARAM_KEY_RE.match(key):
+            raise ValueError(f"Invalid parameter name: {key}")
+    
+    return tuple(pairs)
 
 
 def _parse_query_params(query_params: str) -> Dict[str, str]:
@@ -89,29 +174,13 @@ def _parse_query_params(query_params: str) -> Dict[str, str]:
     Raises:
         ValueError: If query parameters are malformed
     """
-    if not query_params.strip():
-        return {}
+    if not query_params:
+        return _EMPTY_PARAMS
     
-    params = {}
-    try:
-        for param in query_params.split("&"):
-            if "=" in param:
-                key, value = param.split("=", 1)
-                # URL decode the key and value
-                key = unquote_plus(key.strip())
-                value = unquote_plus(value.strip())
-                
-                # Validate parameter names (alphanumeric, underscore, brackets, dots)
-                if not re.match(r'^[a-zA-Z0-9_\[\].]+$', key):
-                    raise ValueError(f"Invalid parameter name: {key}")
-                
-                params[key] = value
-    except Exception as e:
-        raise ValueError(f"Malformed query parameters: {query_params}") from e
-    
-    return params
+    return dict(_parse_query_pairs(query_params))
 
 
+@lru_cache(maxsize=1024)
 def _validate_resource_id(resource_id: str) -> str:
     """Validate and sanitize resource ID.
     
@@ -130,25 +199,181 @@ def _validate_resource_id(resource_id: str) -> str:
     resource_id = resource_id.strip()
     
     # Allow UUIDs, alphanumeric with hyphens/underscores
-    if not re.match(r'^[a-zA-Z0-9_-]+$', resource_id):
+    if not _RESOURCE_ID_RE.match(resource_id):
         raise ValueError(f"Invalid resource ID format: {resource_id}")
     
     return resource_id
 
 
+def _requested_page_limit(params: Dict[str, str]) -> int:
+    """Return the page size requested via ``page[limit]`` or ``limit`` (0 if unset)."""
+    limit = params.get("page[limit]", params.get("limit", ""))
+    return int(limit) if limit.isdigit() else 0
+
+
+class _ResponseByteReader:
+    """Adapt a streaming httpx response to the async ``read()`` interface ijson consumes."""
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; don't consume a chunk for it
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _retry_delay(method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+    """Return how long to wait before retrying a failed response, or None to give up.
+    
+    Rate-limited (429) requests are retried for any method since the API did not
+    process them; server errors (5xx) are only retried for idempotent reads so a
+    submission is never created twice. A Retry-After header is honored when
+    present, otherwise the delay backs off exponentially.
+    """
+    if attempt >= MAX_RETRIES:
+        return None
+    
+    status = response.status_code
+    if status != 429 and not (status >= 500 and method in ("GET", "HEAD")):
+        return None
+    
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        delay = float(retry_after)
+        # Don't stall the tool call for longer than the cap; surface the error instead
+        return delay if delay <= MAX_RETRY_DELAY else None
+    
+    return RETRY_BACKOFF_BASE * 2 ** attempt
+
+
+async def _send_request(
+    client: httpx.AsyncClient,
+    method: str,
+    endpoint: str,
+    params: Dict[str, str],
+    json_data: Optional[Dict[str, Any]],
+    parse_json: bool = True,
+    stream: bool = False
+) -> Dict[str, Any]:
+    """Send a single API request and return the parsed JSON response.
+    
+    When ``parse_json`` is false the body is not decoded and only the HTTP
+    status is returned, which suits bodiless requests such as HEAD. When
+    ``stream`` is true the body is decoded incrementally as it arrives, so the
+    raw payload of a large list page is never buffered in full. Failed
+    connection attempts, rate-limited requests and transient server errors are
+    retried with backoff (see ``_retry_delay``).
+    
+    Raises:
+        httpx.HTTPStatusError: For HTTP errors
+        httpx.RequestError: For network errors
+    """
+    attempt = 0
+    while True:
+        try:
+            if stream and parse_json:
+                async with client.stream(
+                    method,
+                    endpoint,
+                    params=params,
+                    json=json_data
+                ) as response:
+                    if not response.is_error:
+                        return {
+                            key: value
+                            async for key, value in _ijson_backend.kvitems_async(
+                                _ResponseByteReader(response), "", use_float=True
+                            )
+                        }
+                    
+                    # Load the (small) error body so it can be logged by the caller
+                    await response.aread()
+            else:
+                response = await client.request(
+                    method=method,
+                    url=endpoint,
+                    params=params,
+                    json=json_data
+                )
+                
+                if not response.is_error:
+                    if not parse_json:
+                        return {"http_status": response.status_code}
+                    return orjson.loads(response.content)
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+            # The request never reached the API, so retrying is safe for any method
+            if attempt >= MAX_RETRIES:
+                raise
+            delay = RETRY_BACKOFF_BASE * 2 ** attempt
+            attempt += 1
+            logger.warning(
+                f"{method} {endpoint} could not get a connection; "
+                f"retrying in {delay:.2f}s (attempt {attempt}/{MAX_RETRIES})"
+            )
+            await _sleep(delay)
+            continue
+        
+        delay = _retry_delay(method, response, attempt)
+        if delay is None:
+            raise httpx.HTTPStatusError(
+                f"HTTP {response.status_code} {response.reason_phrase} for url '{response.url}'",
+                request=response.request,
+                response=response
+            )
+        
+        attempt += 1
+        logger.warning(
+            f"{method} {endpoint} returned {response.status_code}; "
+            f"retrying in {delay:.2f}s (attempt {attempt}/{MAX_RETRIES})"
+        )
+        await _sleep(delay)
+
+
+def _finish_inflight_request(
+    request_key: Tuple[str, Tuple[Tuple[str, str], ...]],
+    task: "asyncio.Task[Dict[str, Any]]"
+) -> None:
+    """Forget a completed in-flight request so later calls issue a fresh one."""
+    if _inflight_requests.get(request_key) is task:
+        del _inflight_requests[request_key]
+    
+    # Mark the exception as retrieved in case every waiting caller was cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+def _invalidate_reads() -> None:
+    """Drop cached and in-flight reads after a write, since it may change any listing."""
+    global _cache_generation
+    _cache_generation += 1
+    if _get_cache is not None:
+        _get_cache.clear()
+    # Reads already in flight still complete for their callers, but later reads
+    # must not join them
+    _inflight_requests.clear()
+
+
 async def bugcrowd_request(
     method: str, 
     endpoint: str, 
     json_data: Optional[Dict[str, Any]] = None, 
-    **query_params: str
+    params: Optional[Dict[str, str]] = None,
+    parse_json: bool = True,
+    stream: bool = False
 ) -> Dict[str, Any]:
     """Make authenticated requests to the Bugcrowd API with robust error handling.
     
     Args:
         method: HTTP method (GET, POST, PATCH, etc.)
-        endpoint: API endpoint path
+        endpoint: API endpoint path relative to the API base (must start with "/")
         json_data: Optional JSON payload for POST/PATCH requests
-        **query_params: Query parameters as keyword arguments
+        params: Query parameters to send with the request
+        parse_json: Whether to decode the response body; when False only
+                    {"http_status": <code>} is returned
+        stream: Whether to decode the response body incrementally while it
+                downloads (for large list pages)
         
     Returns:
         JSON response from the API
@@ -158,39 +383,72 @@ async def bugcrowd_request(
         httpx.HTTPStatusError: For HTTP errors
         ValueError: For invalid input parameters
     """
+    # Bind hot module globals to locals once per call; the debug check also
+    # skips formatting log messages that would be discarded
+    cache = _get_cache
+    inflight = _inflight_requests
+    debug = logger.isEnabledFor(logging.DEBUG)
+    
+    if params is None:
+        params = _EMPTY_PARAMS
+    
+    # A write may change any listing whether or not it succeeds (a timed-out
+    # request can still be applied server-side), so invalidate reads both
+    # before it is sent and once it has finished
+    is_write = method not in ("GET", "HEAD")
+    if is_write:
+        _invalidate_reads()
+    
     try:
-        credentials = _load_api_credentials()
-        client = await _get_http_client()
-        
-        # Construct URL and headers
-        url = f"{BUGCROWD_API_BASE}{endpoint}"
-        headers = {
-            "Accept": "application/vnd.bugcrowd+json",
-            "Authorization": f"Token {credentials['username']}:{credentials['password']}",
-            "Bugcrowd-Version": BUGCROWD_API_VERSION,
-            "User-Agent": "Bugcrowd-MCP-Server/1.0.0"
-        }
-        
-        # Clean up query_params (remove internal parameters)
-        clean_params = {k: v for k, v in query_params.items() 
-                       if k not in ['query_params'] and v is not None}
-        
-        logger.debug(f"Making {method} request to {endpoint} with params: {clean_params}")
+        client = _http_client
+        if client is None:
+            raise RuntimeError("HTTP client is not initialized; the server lifespan has not started")
+        
+        # Serve idempotent reads from the response cache when enabled
+        request_key = None
+        if method == "GET" and json_data is None and parse_json:
+            request_key = (endpoint, tuple(sorted(params.items())))
+            if cache is not None:
+                cached = cache.get(request_key)
+                if cached is not None:
+                    if debug:
+                        logger.debug(f"Cache hit for {endpoint} with params: {params}")
+                    return cached
+        
+        if request_key is None:
+            if debug:
+                logger.debug(f"Making {method} request to {endpoint} with params: {params}")
+            result = await _send_request(
+                client, method, endpoint, params, json_data, parse_json, stream
+            )
+        else:
+            # Coalesce concurrent identical reads onto a single in-flight request
+            task = inflight.get(request_key)
+            is_leader = task is None
+            if is_leader:
+                generation = _cache_generation
+                if debug:
+                    logger.debug(f"Making {method} request to {endpoint} with params: {params}")
+                task = asyncio.ensure_future(
+                    _send_request(client, method, endpoint, params, json_data, stream=stream)
+                )
+                inflight[request_key] = task
+                task.add_done_callback(partial(_finish_inflight_request, request_key))
+            elif debug:
+                logger.debug(f"Joining in-flight {method} request to {endpoint} with params: {params}")
+            
+            # Shield so one cancelled caller does not cancel the request for the others
+            result = await asyncio.shield(task)
         
-        # Make the request with retry logic
-        response = await client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=clean_params,
-            json=json_data
-        )
+        if debug:
+            logger.debug(f"Successful response from {endpoint}")
         
-        response.raise_for_status()
+        if request_key is not None:
+            # Only the caller that issued the request stores it, and only if no
+            # write completed while it was in flight
+            if is_leader and cache is not None and generation == _cache_generation:
+                cache[request_key] = result
         
-        # Return parsed JSON response
-        result = response.json()
-        logger.debug(f"Successful response from {endpoint}")
         return result
         
     except httpx.HTTPStatusError as e:
@@ -215,6 +473,10 @@ async def bugcrowd_request(
     except Exception as e:
         logger.error(f"Unexpected error for {method} {endpoint}: {str(e)}")
         raise RuntimeError(f"Unexpected error during API request: {str(e)}") from e
+    
+    finally:
+        if is_write:
+            _invalidate_reads()
 
 
 async def _cleanup_http_client():
@@ -223,11 +485,24 @@ async def _cleanup_http_client():
     if _http_client and not _http_client.is_closed:
         await _http_client.aclose()
         logger.info("HTTP client closed")
+    _http_client = None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Create the shared HTTP client on startup and close it on shutdown."""
+    global _http_client
+    _http_client = _create_http_client()
+    try:
+        yield
+    finally:
+        await _cleanup_http_client()
 
 # Create the MCP server with OpenAI-friendly configuration
 mcp = FastMCP(
     "Bugcrowd-MCP", 
-    description="High-performance MCP server providing secure access to Bugcrowd bug bounty platform API for defensive security research and vulnerability management"
+    description="High-performance MCP server providing secure access to Bugcrowd bug bounty platform API for defensive security research and vulnerability management",
+    lifespan=_lifespan
 )
 
 
@@ -237,7 +512,9 @@ async def _make_api_request(
     endpoint: str,
     resource_id: Optional[str] = None,
     query_params: str = "",
-    json_data: Optional[Dict[str, Any]] = None
+    json_data: Optional[Dict[str, Any]] = None,
+    parse_json: bool = True,
+    stream_large_pages: bool = False
 ) -> Dict[str, Any]:
     """Helper function for making API requests with consistent parameter handling.
     
@@ -247,6 +524,10 @@ async def _make_api_request(
         resource_id: Optional resource ID to append to endpoint
         query_params: Query parameters string
         json_data: Optional JSON payload
+        parse_json: Whether to decode the response body
+        stream_large_pages: Stream-decode the response when the requested page
+                            size exceeds STREAM_PAGE_LIMIT_THRESHOLD and
+                            ijson's C backend is available
         
     Returns:
         API response data
@@ -260,8 +541,17 @@ async def _make_api_request(
     # Parse query parameters
     parsed_params = _parse_query_params(query_params)
     
+    # Stream-decode large list pages to bound peak memory
+    stream = (
+        stream_large_pages
+        and _ijson_backend is not None
+        and _requested_page_limit(parsed_params) > STREAM_PAGE_LIMIT_THRESHOLD
+    )
+    
     # Make the request
-    return await bugcrowd_request(method, full_endpoint, json_data, **parsed_params)
+    return await bugcrowd_request(
+        method, full_endpoint, json_data, params=parsed_params, parse_json=parse_json, stream=stream
+    )
 
 # ORGANIZATIONS - Core entity management
 @mcp.tool()
@@ -354,7 +644,7 @@ async def get_submissions(query_params: str = "") -> Dict[str, Any]:
     Example:
         >>> await get_submissions("filter[program_id]=prog-123&include=activities")
     """
-    return await _make_api_request("GET", "/submissions", query_params=query_params)
+    return await _make_api_request("GET", "/submissions", query_params=query_params, stream_large_pages=True)
 
 
 @mcp.tool()
@@ -458,7 +748,7 @@ async def get_reports(query_params: str = "") -> Dict[str, Any]:
     Example:
         >>> await get_reports("filter[assignee_id]=user-123&limit=10")
     """
-    return await _make_api_request("GET", "/reports", query_params=query_params)
+    return await _make_api_request("GET", "/reports", query_params=query_params, stream_large_pages=True)
 
 
 @mcp.tool()
@@ -611,9 +901,9 @@ async def get_user(id: str, query_params: str = "") -> Dict[str, Any]:
     """
     return await _make_api_request("GET", "/users", resource_id=id, query_params=query_params)
 
-# Cleanup function to be called on server shutdown
+# HEALTH - Server and API connectivity
 @mcp.tool()
-async def server_health() -> Dict[str, str]:
+async def server_health() -> Dict[str, Any]:
     """Check the health status of the MCP server and API connectivity.
     
     Returns:
@@ -621,14 +911,17 @@ async def server_health() -> Dict[str, str]:
         
     Example:
         >>> await server_health()
-        {"status": "healthy", "api_connection": "ok", "version": "1.0.0"}
+        {"status": "healthy", "api_connection": "ok", "http_status": 200, "version": "1.0.0"}
     """
     try:
-        # Test API connectivity with a simple request
-        await _make_api_request("GET", "/organizations", query_params="page[limit]=1")
+        # Test API connectivity with a HEAD request so no response body is transferred
+        result = await _make_api_request(
+            "HEAD", "/organizations", query_params="page[limit]=1", parse_json=False
+        )
         return {
             "status": "healthy",
             "api_connection": "ok",
+            "http_status": result["http_status"],
             "version": "1.0.0",
             "bugcrowd_api_version": BUGCROWD_API_VERSION
         }
@@ -645,6 +938,15 @@ async def server_health() -> Dict[str, str]:
 if __name__ == "__main__":
     try:
         logger.info("Starting Bugcrowd MCP Server")
+        
+        # Use uvloop's faster event loop where available (not supported on Windows)
+        try:
+            import uvloop
+            uvloop.install()
+            logger.info("Using uvloop event loop")
+        except ImportError:
+            pass
+        
         mcp.run("stdio")
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
@@ -652,10 +954,5 @@ if __name__ == "__main__":
         logger.error(f"Server error: {str(e)}")
         raise
     finally:
-        # Clean up resources
-        import asyncio
-        try:
-            asyncio.run(_cleanup_http_client())
-        except:
-            pass  # Ignore cleanup errors
+        # The HTTP client is closed by the server lifespan on the serving event loop
         logger.info("Bugcrowd MCP Server stopped")
\ No newline at end of file
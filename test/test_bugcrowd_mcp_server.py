@@ -0,0 +1,376 @@
+"""Tests for the Bugcrowd MCP server request helpers."""
+
+import asyncio
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+import bugcrowd_mcp_server as server
+
+
+@pytest.fixture
+async def mock_api(monkeypatch):
+    """Install a shared HTTP client whose requests are answered by a given handler."""
+    monkeypatch.setenv("BUGCROWD_API_USERNAME", "user")
+    monkeypatch.setenv("BUGCROWD_API_PASSWORD", "pass")
+    clients = []
+    
+    def install(handler):
+        client = httpx.AsyncClient(
+            base_url=server.BUGCROWD_API_BASE,
+            headers=server._DEFAULT_HEADERS,
+            auth=server.BugcrowdAuth(),
+            transport=httpx.MockTransport(handler)
+        )
+        monkeypatch.setattr(server, "_http_client", client)
+        clients.append(client)
+    
+    yield install
+    
+    for client in clients:
+        await client.aclose()
+
+
+def test_parse_query_params_strips_keys_and_values():
+    assert server._parse_query_params("a=1 & b=2") == {"a": "1", "b": "2"}
+
+
+def test_parse_query_params_decodes_values():
+    assert server._parse_query_params("filter[status]=open+x&limit=10") == {
+        "filter[status]": "open x",
+        "limit": "10",
+    }
+
+
+def test_parse_query_params_skips_segments_without_equals():
+    assert server._parse_query_params("foo") == {}
+    assert server._parse_query_params("foo&limit=5") == {"limit": "5"}
+
+
+def test_parse_query_params_keeps_blank_values():
+    assert server._parse_query_params("foo=&x=1") == {"foo": "", "x": "1"}
+
+
+def test_parse_query_params_rejects_invalid_names():
+    with pytest.raises(ValueError):
+        server._parse_query_params("a b=1")
+
+
+async def test_reserved_argument_names_are_sent_as_query_params(mock_api):
+    seen = []
+    
+    def handler(request):
+        seen.append(dict(request.url.params))
+        return httpx.Response(200, json={"data": []})
+    
+    mock_api(handler)
+    
+    await server._make_api_request("GET", "/programs", query_params="stream=1&parse_json=0")
+    
+    assert seen == [{"stream": "1", "parse_json": "0"}]
+
+
+async def test_requests_use_token_authorization(mock_api):
+    seen = []
+    
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"data": []})
+    
+    mock_api(handler)
+    
+    await server.get_programs()
+    
+    assert seen == ["Token user:pass"]
+
+
+async def test_missing_credentials_are_reported(mock_api, monkeypatch):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200)
+    
+    mock_api(handler)
+    monkeypatch.delenv("BUGCROWD_API_PASSWORD")
+    
+    with pytest.raises(RuntimeError, match="BUGCROWD_API_PASSWORD"):
+        await server.get_programs()
+    
+    health = await server.server_health()
+    assert health["status"] == "unhealthy"
+    assert "BUGCROWD_API_USERNAME" in health["error"]
+    assert calls == []
+
+
+async def test_read_in_flight_during_write_is_not_cached(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "_get_cache", TTLCache(maxsize=8, ttl=60))
+    release = asyncio.Event()
+    reads = []
+    
+    async def handler(request):
+        if request.method == "PATCH":
+            return httpx.Response(200, json={"data": {"state": "triaged"}})
+        reads.append(request.url.path)
+        count = len(reads)
+        if count == 1:
+            await release.wait()
+        return httpx.Response(200, json={"data": count})
+    
+    mock_api(handler)
+    
+    stale_read = asyncio.create_task(server.get_submissions())
+    await asyncio.sleep(0)
+    await server.update_submission("sub-1", {"state": "triaged"})
+    release.set()
+    assert await stale_read == {"data": 1}
+    
+    # The pre-write response must not have been cached
+    assert await server.get_submissions() == {"data": 2}
+    assert await server.get_submissions() == {"data": 2}
+    assert reads == ["/submissions", "/submissions"]
+
+
+async def test_failed_write_still_invalidates_cached_reads(mock_api, monkeypatch):
+    monkeypatch.setattr(server, "_get_cache", TTLCache(maxsize=8, ttl=60))
+    reads = []
+    
+    def handler(request):
+        if request.method == "PATCH":
+            raise httpx.ReadTimeout("timed out", request=request)
+        reads.append(request.url.path)
+        return httpx.Response(200, json={"data": len(reads)})
+    
+    mock_api(handler)
+    
+    assert await server.get_submissions() == {"data": 1}
+    with pytest.raises(RuntimeError):
+        await server.update_submission("sub-1", {"state": "triaged"})
+    
+    # The write may have been applied server-side, so the cached read is dropped
+    assert await server.get_submissions() == {"data": 2}
+    assert reads == ["/submissions", "/submissions"]
+
+
+async def test_read_after_write_does_not_join_earlier_read(mock_api):
+    release = asyncio.Event()
+    reads = []
+    
+    async def handler(request):
+        if request.method == "PATCH":
+            return httpx.Response(200, json={"data": {"state": "triaged"}})
+        reads.append(request.url.path)
+        count = len(reads)
+        if count == 1:
+            await release.wait()
+        return httpx.Response(200, json={"data": count})
+    
+    mock_api(handler)
+    
+    stale_read = asyncio.create_task(server.get_submissions())
+    await asyncio.sleep(0)
+    await server.update_submission("sub-1", {"state": "triaged"})
+    
+    fresh_read = asyncio.create_task(server.get_submissions())
+    await asyncio.sleep(0)
+    release.set()
+    
+    assert await stale_read == {"data": 1}
+    assert await fresh_read == {"data": 2}
+
+
+async def test_concurrent_identical_reads_share_one_request(mock_api):
+    reads = []
+    
+    async def handler(request):
+        reads.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": []})
+    
+    mock_api(handler)
+    
+    results = await asyncio.gather(*(server.get_programs("page[limit]=3") for _ in range(5)))
+    
+    assert results == [{"data": []}] * 5
+    assert reads == ["/programs"]
+
+
+async def test_server_health_sends_uncached_head(mock_api, monkeypatch):
+    cache = TTLCache(maxsize=8, ttl=60)
+    cache[("/programs", ())] = {"data": []}
+    monkeypatch.setattr(server, "_get_cache", cache)
+    invalidations = []
+    monkeypatch.setattr(server, "_invalidate_reads", lambda: invalidations.append(True))
+    seen = []
+    
+    def handler(request):
+        seen.append((request.method, request.url.path, dict(request.url.params)))
+        assert server._inflight_requests == {}
+        return httpx.Response(200)
+    
+    mock_api(handler)
+    
+    result = await server.server_health()
+    
+    assert result["status"] == "healthy"
+    assert result["http_status"] == 200
+    assert seen == [("HEAD", "/organizations", {"page[limit]": "1"})]
+    assert dict(cache) == {("/programs", ()): {"data": []}}
+    assert invalidations == []
+
+
+LARGE_PAGE = {
+    "data": [{"id": f"sub-{i}", "score": 1.5} for i in range(500)],
+    "meta": {"count": 500, "total_hits": 1200},
+    "links": {"next": "/submissions?page[offset]=500"},
+}
+
+
+@pytest.fixture
+def byte_readers(monkeypatch):
+    """Record every streaming reader the server creates."""
+    created = []
+    
+    class RecordingReader(server._ResponseByteReader):
+        def __init__(self, response):
+            super().__init__(response)
+            created.append(response)
+    
+    monkeypatch.setattr(server, "_ResponseByteReader", RecordingReader)
+    return created
+
+
+@pytest.mark.skipif(server._ijson_backend is None, reason="ijson C backend not installed")
+async def test_large_page_is_stream_decoded(mock_api, byte_readers):
+    mock_api(lambda request: httpx.Response(200, json=LARGE_PAGE))
+    
+    result = await server.get_submissions("page[limit]=500")
+    
+    assert result == LARGE_PAGE
+    assert isinstance(result["data"][0]["score"], float)
+    assert len(byte_readers) == 1
+
+
+async def test_small_page_is_not_stream_decoded(mock_api, byte_readers):
+    mock_api(lambda request: httpx.Response(200, json=LARGE_PAGE))
+    
+    assert await server.get_submissions("page[limit]=10") == LARGE_PAGE
+    assert byte_readers == []
+
+
+async def test_large_page_without_c_backend_uses_orjson(mock_api, byte_readers, monkeypatch):
+    monkeypatch.setattr(server, "_ijson_backend", None)
+    mock_api(lambda request: httpx.Response(200, json=LARGE_PAGE))
+    
+    assert await server.get_reports("limit=500") == LARGE_PAGE
+    assert byte_readers == []
+
+
+@pytest.mark.skipif(server._ijson_backend is None, reason="ijson C backend not installed")
+async def test_streamed_error_is_mapped(mock_api):
+    mock_api(lambda request: httpx.Response(404, text="not found"))
+    
+    with pytest.raises(RuntimeError, match="Resource not found"):
+        await server.get_submissions("page[limit]=500")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays without actually sleeping."""
+    delays = []
+    
+    async def fake_sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(server, "_sleep", fake_sleep)
+    return delays
+
+
+async def test_rate_limited_request_honors_retry_after(mock_api, sleeps):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(200, json={"data": []}),
+    ])
+    mock_api(lambda request: next(responses))
+    
+    assert await server.get_programs() == {"data": []}
+    assert sleeps == [2.0]
+
+
+async def test_retry_after_above_cap_is_not_waited_on(mock_api, sleeps):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "120"})
+    
+    mock_api(handler)
+    
+    with pytest.raises(RuntimeError, match="Rate limit exceeded"):
+        await server.get_programs()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+async def test_post_is_not_retried_on_server_error(mock_api, sleeps):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+    
+    mock_api(handler)
+    
+    with pytest.raises(RuntimeError, match="status 500"):
+        await server.create_submission({"title": "XSS", "description": "details"})
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+async def test_read_gives_up_after_max_retries(mock_api, sleeps):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+    
+    mock_api(handler)
+    
+    with pytest.raises(RuntimeError, match="status 503"):
+        await server.get_programs()
+    assert len(calls) == server.MAX_RETRIES + 1
+    assert sleeps == [server.RETRY_BACKOFF_BASE * 2 ** i for i in range(server.MAX_RETRIES)]
+
+
+async def test_failed_connect_is_retried(mock_api, sleeps):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(201, json={"data": {"id": "sub-1"}})
+    
+    mock_api(handler)
+    
+    result = await server.create_submission({"title": "XSS", "description": "details"})
+    
+    assert result == {"data": {"id": "sub-1"}}
+    assert len(calls) == 2
+
+
+async def test_pool_timeout_is_retried(mock_api, sleeps):
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.PoolTimeout("no free connection", request=request)
+        return httpx.Response(200, json={"data": []})
+    
+    mock_api(handler)
+    
+    assert await server.get_programs() == {"data": []}
+    assert len(calls) == 2
+    assert sleeps == [server.RETRY_BACKOFF_BASE]